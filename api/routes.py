@@ -3,6 +3,7 @@ from core.connector_manager import ConnectorManager
 from core.query_engine import QueryEngine
 from core.cache_manager import CacheManager
 from models.connector_config import ConnectorConfig
+from models.stored_query import StoredQuery
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -178,8 +179,7 @@ def create_stored_query():
         data = request.get_json()
         
         # Validate required fields
-        required_fields = ['query_id', 'query_name', 'connector_id', 'parameters']
-        for field in required_fields:
+        for field in StoredQuery.REQUIRED_FIELDS:
             if field not in data:
                 return jsonify({"success": False, "error": f"Missing required field: {field}"}), 400
         
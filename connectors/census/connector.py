@@ -1,7 +1,10 @@
 import requests
 from typing import Dict, Any, List
 from core.base_connector import BaseConnector
+from collections import OrderedDict
+from itertools import chain, repeat
 import logging
+import threading
 import time
 
 logging.basicConfig(level=logging.INFO)
@@ -20,6 +23,9 @@ class CensusConnector(BaseConnector):
         self.api_key = config.get("api_key")  # Optional but recommended
         self.max_retries = config.get("max_retries", 3)
         self.retry_delay = config.get("retry_delay", 1)
+        self.variables_cache_size = config.get("variables_cache_size", 4)
+        self._variables_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._variables_lock = threading.Lock()
     
     def connect(self) -> bool:
         """Establish connection by validating API access."""
@@ -83,6 +89,13 @@ class CensusConnector(BaseConnector):
         # Build query parameters
         query_params = {k: v for k, v in parameters.items() if k != "dataset"}
         
+        # Request each variable once, keeping the caller's order
+        variables = query_params.get("get")
+        if isinstance(variables, str):
+            query_params["get"] = ",".join(
+                dict.fromkeys(v.strip() for v in variables.split(",") if v.strip())
+            )
+        
         if self.api_key:
             query_params["key"] = self.api_key
         
@@ -142,13 +155,11 @@ class CensusConnector(BaseConnector):
         # First row contains headers
         headers = data[0]
         
-        # Convert remaining rows to dictionaries
-        records = []
-        for row in data[1:]:
-            record = {}
-            for i, header in enumerate(headers):
-                record[header] = row[i] if i < len(row) else None
-            records.append(record)
+        # Convert remaining rows to dictionaries, padding short rows with None
+        records = [
+            dict(zip(headers, chain(row, repeat(None))))
+            for row in data[1:]
+        ]
         
         # Create standardized response
         standardized = {
@@ -212,18 +223,40 @@ class CensusConnector(BaseConnector):
         """
         Get available variables for a dataset.
         
+        Variable definitions are fixed for a published dataset, so successful
+        lookups are cached on the connector instance, keeping the
+        ``variables_cache_size`` most recently used datasets.
+        
         Args:
             dataset: Dataset identifier
             
         Returns:
-            Dict of variable definitions
+            Dict of variable definitions. The dict is shared with the cache,
+            so callers must copy it before modifying it.
         """
+        with self._variables_lock:
+            cached = self._variables_cache.get(dataset)
+            if cached is not None:
+                self._variables_cache.move_to_end(dataset)
+                return cached
+        
         try:
             variables_url = f"{self.base_url}/{dataset}/variables.json"
             response = requests.get(variables_url, timeout=10)
             if response.status_code == 200:
-                return response.json()
+                variables = response.json()
+                if self.variables_cache_size > 0:
+                    with self._variables_lock:
+                        self._variables_cache[dataset] = variables
+                        while len(self._variables_cache) > self.variables_cache_size:
+                            self._variables_cache.popitem(last=False)
+                return variables
         except Exception as e:
             logger.error(f"Failed to retrieve variables: {str(e)}")
         
         return {}
+    
+    def clear_variables_cache(self):
+        """Drop all cached dataset variable definitions."""
+        with self._variables_lock:
+            self._variables_cache.clear()
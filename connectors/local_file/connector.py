@@ -245,14 +245,16 @@ class LocalFileConnector(BaseConnector):
         """
         try:
             df = self._read_file()
+            null_counts = df.isnull().sum()
+            unique_counts = df.nunique()
             columns = []
             
-            for col in df.columns:
+            for col, dtype in df.dtypes.items():
                 col_info = {
                     "name": col,
-                    "type": str(df[col].dtype),
-                    "null_count": int(df[col].isnull().sum()),
-                    "unique_count": int(df[col].nunique())
+                    "type": str(dtype),
+                    "null_count": int(null_counts[col]),
+                    "unique_count": int(unique_counts[col])
                 }
                 columns.append(col_info)
             
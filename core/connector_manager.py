@@ -86,7 +86,8 @@ class ConnectorManager:
         Returns:
             BaseConnector instance or None if not found
         """
-        if source_id not in self.connectors:
+        connector = self.connectors.get(source_id)
+        if connector is None:
             config = self.config_model.get_by_source_id(source_id)
             if config and config.get("active"):
                 connector_type = config["connector_type"]
@@ -98,7 +99,7 @@ class ConnectorManager:
                     else:
                         return None
         
-        return self.connectors.get(source_id)
+        return connector
     
     def query(self, source_id: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -39,12 +39,14 @@ class DataAnalysisEngine:
 
     def exploratory_analysis(self, df: pd.DataFrame) -> Dict[str, Any]:
         sample_records = df.head(5).to_dict(orient="records")
-        distribution = {
-            col: df[col].value_counts().head(5).to_dict()
-            for col in df.columns if df[col].dtype == "object"
-        }
+        data_types = {}
+        distribution = {}
+        for col, dtype in df.dtypes.items():
+            data_types[col] = str(dtype)
+            if dtype == "object":
+                distribution[col] = df[col].value_counts().head(5).to_dict()
         return {
-            "data_types": df.dtypes.astype(str).to_dict(),
+            "data_types": data_types,
             "sample_records": sample_records,
             "distribution": distribution,
             "missing_percentage": (df.isna().mean() * 100).round(2).to_dict(),
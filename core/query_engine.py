@@ -130,13 +130,9 @@ class QueryEngine:
                     "query_id": query_id
                 }
             
-            # Get connector_id and parameters
+            # Get connector_id and parameters, applying overrides if provided
             connector_id = stored_query["connector_id"]
-            parameters = stored_query["parameters"].copy()
-            
-            # Apply parameter overrides if provided
-            if parameter_overrides:
-                parameters.update(parameter_overrides)
+            parameters = {**stored_query["parameters"], **(parameter_overrides or {})}
             
             # Execute the query with query_id reference
             result = self.execute_query(connector_id, parameters, use_cache, query_id=query_id)
@@ -393,13 +389,21 @@ class QueryEngine:
         }
 
     @staticmethod
-    def _extract_records(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _extract_records(
+        result: Dict[str, Any]
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         payload = result.get("data", {})
         if isinstance(payload, dict):
-            data = payload.get("data", [])
-        else:
-            data = payload
-        return data or []
+            payload = payload.get("data", [])
+        if (
+            isinstance(payload, dict)
+            and payload
+            and all(pd.api.types.is_scalar(value) for value in payload.values())
+        ):
+            # Single-record payloads are wrapped so they build a one-row DataFrame;
+            # columnar dicts (of lists, dicts, arrays, ...) pass through for pandas
+            return [payload]
+        return payload or []
 
     @staticmethod
     def _apply_aggregation(df: pd.DataFrame, aggregation: Dict[str, Any]) -> pd.DataFrame:
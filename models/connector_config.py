@@ -31,8 +31,9 @@ class ConnectorConfig:
         Returns:
             str: ID of the created configuration
         """
-        config_data["created_at"] = datetime.utcnow()
-        config_data["updated_at"] = datetime.utcnow()
+        now = datetime.utcnow()
+        config_data["created_at"] = now
+        config_data["updated_at"] = now
         config_data["active"] = config_data.get("active", True)
         
         result = self.collection.insert_one(config_data)
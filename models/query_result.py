@@ -62,14 +62,15 @@ class QueryResult:
             ttl = Config.CACHE_TTL
         
         query_hash = self._generate_hash(source_id, parameters)
-        expires_at = datetime.utcnow() + timedelta(seconds=ttl)
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=ttl)
         
         cache_entry = {
             "query_hash": query_hash,
             "source_id": source_id,
             "parameters": parameters,
             "result": result,
-            "created_at": datetime.utcnow(),
+            "created_at": now,
             "expires_at": expires_at,
             "hit_count": 0
         }
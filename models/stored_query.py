@@ -30,6 +30,8 @@ class StoredQuery:
         created_by: Optional user identifier
     """
     
+    REQUIRED_FIELDS = ('query_id', 'query_name', 'connector_id', 'parameters')
+    
     def __init__(self):
         """Initialize StoredQuery model."""
         self.client = MongoClient(Config.MONGO_URI)
@@ -75,8 +77,7 @@ class StoredQuery:
             dict: Created query document
         """
         # Validate required fields
-        required_fields = ['query_id', 'query_name', 'connector_id', 'parameters']
-        for field in required_fields:
+        for field in self.REQUIRED_FIELDS:
             if field not in query_data:
                 raise ValueError(f"Missing required field: {field}")
         
@@ -267,12 +267,15 @@ def display_results(result, max_records=10, example_notes=None, query_name=None)
     print(f"\nShowing first {min(max_records, len(records))} record(s):")
     print("-"*70)
     
+    # Try to show most relevant fields first, then crime statistics
+    priority_fields = ['year', 'state_abbr', 'state_name', 'population']
+    crime_fields = ['violent_crime', 'homicide', 'rape', 'robbery', 'aggravated_assault',
+                   'property_crime', 'burglary', 'larceny', 'motor_vehicle_theft', 'arson']
+    known_fields = set(priority_fields) | set(crime_fields)
+    
     for i, record in enumerate(records[:max_records], 1):
         print(f"\nRecord {i}:")
         
-        # Try to show most relevant fields first
-        priority_fields = ['year', 'state_abbr', 'state_name', 'population']
-        
         # Show priority fields
         for field in priority_fields:
             if field in record:
@@ -283,9 +286,6 @@ def display_results(result, max_records=10, example_notes=None, query_name=None)
                 print(f"  {field}: {value}")
         
         # Show crime statistics
-        crime_fields = ['violent_crime', 'homicide', 'rape', 'robbery', 'aggravated_assault',
-                       'property_crime', 'burglary', 'larceny', 'motor_vehicle_theft', 'arson']
-        
         for field in crime_fields:
             if field in record:
                 value = record[field]
@@ -294,7 +294,7 @@ def display_results(result, max_records=10, example_notes=None, query_name=None)
         
         # Show other fields (limited)
         other_fields = {k: v for k, v in record.items() 
-                       if k not in priority_fields + crime_fields}
+                       if k not in known_fields}
         
         shown_other = 0
         for key, value in other_fields.items():
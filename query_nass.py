@@ -246,16 +246,17 @@ def display_results(result, max_records=10, query_name=None):
     print(f"\nShowing first {min(max_records, len(records))} record(s):")
     print("-"*70)
     
+    key_fields = {'commodity_desc', 'state_alpha', 'year', 'Value', 'unit_desc'}
+    
     for i, record in enumerate(records[:max_records], 1):
         print(f"\nRecord {i}:")
         for key, value in record.items():
             # Show key fields prominently
-            if key in ['commodity_desc', 'state_alpha', 'year', 'Value', 'unit_desc']:
+            if key in key_fields:
                 print(f"  {key}: {value}")
         
         # Show a few other fields
-        other_fields = [k for k in record.keys() 
-                       if k not in ['commodity_desc', 'state_alpha', 'year', 'Value', 'unit_desc']]
+        other_fields = [k for k in record if k not in key_fields]
         if other_fields[:3]:
             print(f"  ... and {len(other_fields)} more fields")
     
@@ -0,0 +1,9 @@
+import pytest
+
+from core.data_analysis import DataAnalysisEngine
+
+
+@pytest.fixture(scope="session")
+def analysis_engine():
+    # DataAnalysisEngine is stateless, so one instance serves every test
+    return DataAnalysisEngine()
@@ -0,0 +1,90 @@
+import pytest
+
+from connectors.census import connector as census_module
+from connectors.census.connector import CensusConnector
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+@pytest.fixture
+def fake_get(monkeypatch):
+    calls = []
+    responses = []
+
+    def _get(url, params=None, **_kwargs):
+        calls.append((url, params))
+        return responses.pop(0)
+
+    monkeypatch.setattr(census_module.requests, "get", _get)
+    return calls, responses
+
+
+def test_get_dataset_variables_caches_successful_lookups(fake_get):
+    calls, responses = fake_get
+    responses.append(FakeResponse(200, {"variables": {"NAME": {"label": "Name"}}}))
+    census = CensusConnector({})
+
+    first = census.get_dataset_variables("2020/dec/pl")
+    second = census.get_dataset_variables("2020/dec/pl")
+
+    assert len(calls) == 1
+    assert first == second == {"variables": {"NAME": {"label": "Name"}}}
+    assert type(first) is dict
+
+
+def test_get_dataset_variables_does_not_cache_failures(fake_get):
+    calls, responses = fake_get
+    responses.extend([FakeResponse(500), FakeResponse(200, {"variables": {}})])
+    census = CensusConnector({})
+
+    assert census.get_dataset_variables("2020/dec/pl") == {}
+    assert census.get_dataset_variables("2020/dec/pl") == {"variables": {}}
+    assert len(calls) == 2
+
+
+def test_get_dataset_variables_evicts_least_recently_used(fake_get):
+    calls, responses = fake_get
+    responses.extend(FakeResponse(200, {"variables": {}}) for _ in range(3))
+    census = CensusConnector({"variables_cache_size": 1})
+
+    census.get_dataset_variables("2020/dec/pl")
+    census.get_dataset_variables("2020/acs/acs5")
+    census.get_dataset_variables("2020/dec/pl")
+
+    assert len(calls) == 3
+
+
+def test_clear_variables_cache_forces_refetch(fake_get):
+    calls, responses = fake_get
+    responses.extend(FakeResponse(200, {"variables": {}}) for _ in range(2))
+    census = CensusConnector({})
+
+    census.get_dataset_variables("2020/dec/pl")
+    census.get_dataset_variables("2020/dec/pl")
+    census.clear_variables_cache()
+    census.get_dataset_variables("2020/dec/pl")
+
+    assert len(calls) == 2
+
+
+def test_query_requests_each_variable_once(fake_get):
+    calls, responses = fake_get
+    responses.append(FakeResponse(200, [["NAME", "B01001_001E"], ["Alabama", "5024279"]]))
+    census = CensusConnector({})
+    census.connected = True
+
+    result = census.query({
+        "dataset": "2020/acs/acs5",
+        "get": "NAME, B01001_001E,NAME,",
+        "for": "state:01",
+    })
+
+    assert calls[0][1]["get"] == "NAME,B01001_001E"
+    assert result["data"] == [{"NAME": "Alabama", "B01001_001E": "5024279"}]
@@ -1,10 +1,8 @@
 import pandas as pd
 import pytest
 
-from core.data_analysis import DataAnalysisEngine
 
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_df():
     return pd.DataFrame(
         {
@@ -18,10 +16,9 @@ def sample_df():
     )
 
 
-def test_basic_and_exploratory_statistics(sample_df):
-    engine = DataAnalysisEngine()
-    stats = engine.basic_statistics(sample_df)
-    exploratory = engine.exploratory_analysis(sample_df)
+def test_basic_and_exploratory_statistics(analysis_engine, sample_df):
+    stats = analysis_engine.basic_statistics(sample_df)
+    exploratory = analysis_engine.exploratory_analysis(sample_df)
 
     assert stats["row_count"] == 6
     assert "value" in stats["numeric_summary"]
@@ -29,17 +26,15 @@ def test_basic_and_exploratory_statistics(sample_df):
     assert "state" in exploratory["distribution"]
 
 
-def test_inferential_and_time_series(sample_df):
-    engine = DataAnalysisEngine()
-
-    inferential = engine.inferential_analysis(
+def test_inferential_and_time_series(analysis_engine, sample_df):
+    inferential = analysis_engine.inferential_analysis(
         sample_df,
         comparisons=[{"x": "value", "y": "population", "test": "pearson"}],
     )
     assert len(inferential) == 1
     assert "p_value" in inferential[0]
 
-    ts = engine.time_series_analysis(
+    ts = analysis_engine.time_series_analysis(
         sample_df,
         time_column="date",
         target_column="value",
@@ -49,17 +44,15 @@ def test_inferential_and_time_series(sample_df):
     assert "trend_slope" in ts
 
 
-def test_regression_methods(sample_df):
-    engine = DataAnalysisEngine()
-
-    linear = engine.linear_regression(
+def test_regression_methods(analysis_engine, sample_df):
+    linear = analysis_engine.linear_regression(
         sample_df,
         features=["harvest"],
         target="value",
     )
     assert "coefficients" in linear
 
-    forest = engine.random_forest_regression(
+    forest = analysis_engine.random_forest_regression(
         sample_df,
         features=["harvest"],
         target="value",
@@ -68,17 +61,15 @@ def test_regression_methods(sample_df):
     assert "feature_importance" in forest
 
 
-def test_multivariate_and_predictive(sample_df):
-    engine = DataAnalysisEngine()
-
-    multivariate = engine.multivariate_analysis(
+def test_multivariate_and_predictive(analysis_engine, sample_df):
+    multivariate = analysis_engine.multivariate_analysis(
         sample_df,
         features=["value", "population", "harvest"],
         n_components=2,
     )
     assert len(multivariate["components"]) == 2
 
-    predictive = engine.predictive_analysis(
+    predictive = analysis_engine.predictive_analysis(
         sample_df,
         features=["harvest"],
         target="value",
@@ -88,8 +79,7 @@ def test_multivariate_and_predictive(sample_df):
     assert predictive["model_type"] == "forest"
 
 
-def test_run_suite(sample_df):
-    engine = DataAnalysisEngine()
+def test_run_suite(analysis_engine, sample_df):
     plan = {
         "basic_statistics": True,
         "exploratory": True,
@@ -98,7 +88,7 @@ def test_run_suite(sample_df):
         "linear_regression": {"features": ["harvest"], "target": "value"},
         "multivariate": {"features": ["harvest", "value"], "n_components": 2},
     }
-    results = engine.run_suite(sample_df, plan)
+    results = analysis_engine.run_suite(sample_df, plan)
 
     assert "basic_statistics" in results
     assert "linear_regression" in results
@@ -1,7 +1,6 @@
 import pandas as pd
 import pytest
 
-from core.data_analysis import DataAnalysisEngine
 from core.query_engine import QueryEngine
 
 
@@ -37,11 +36,11 @@ class FakeCacheManager:
 
 
 class SampleQueryEngine(QueryEngine):
-    def __init__(self, responses):
+    def __init__(self, responses, analysis_engine):
         super().__init__(
             connector_manager=FakeConnectorManager(),
             cache_manager=FakeCacheManager(),
-            analysis_engine=DataAnalysisEngine(),
+            analysis_engine=analysis_engine,
             stored_query=InMemoryStoredQuery(),
         )
         self._responses = responses
@@ -53,45 +52,46 @@ class SampleQueryEngine(QueryEngine):
         return response
 
 
-@pytest.fixture
-def sample_responses():
-    return {
-        "census_api": {
-            "success": True,
-            "data": {
-                "data": [
-                    {"state": "AL", "year": 2020, "population": 10},
-                    {"state": "AK", "year": 2020, "population": 20},
-                    {"state": "AZ", "year": 2020, "population": 30},
-                    {"state": "AR", "year": 2020, "population": 40},
-                    {"state": "CA", "year": 2020, "population": 50},
-                    {"state": "CO", "year": 2020, "population": 60},
-                ]
-            },
+# Read-only payloads shared by every test; the engine never mutates them.
+SAMPLE_RESPONSES = {
+    "census_api": {
+        "success": True,
+        "data": {
+            "data": [
+                {"state": "AL", "year": 2020, "population": 10},
+                {"state": "AK", "year": 2020, "population": 20},
+                {"state": "AZ", "year": 2020, "population": 30},
+                {"state": "AR", "year": 2020, "population": 40},
+                {"state": "CA", "year": 2020, "population": 50},
+                {"state": "CO", "year": 2020, "population": 60},
+            ]
         },
-        "usda_quickstats": {
-            "success": True,
-            "data": {
-                "data": [
-                    {"state": "AL", "year": 2020, "corn_value": 1.0},
-                    {"state": "AK", "year": 2020, "corn_value": 2.0},
-                    {"state": "AZ", "year": 2020, "corn_value": 3.0},
-                    {"state": "AR", "year": 2020, "corn_value": 4.0},
-                    {"state": "CA", "year": 2020, "corn_value": 5.0},
-                    {"state": "CO", "year": 2020, "corn_value": 6.0},
-                ]
-            },
+    },
+    "usda_quickstats": {
+        "success": True,
+        "data": {
+            "data": [
+                {"state": "AL", "year": 2020, "corn_value": 1.0},
+                {"state": "AK", "year": 2020, "corn_value": 2.0},
+                {"state": "AZ", "year": 2020, "corn_value": 3.0},
+                {"state": "AR", "year": 2020, "corn_value": 4.0},
+                {"state": "CA", "year": 2020, "corn_value": 5.0},
+                {"state": "CO", "year": 2020, "corn_value": 6.0},
+            ]
         },
-    }
+    },
+}
 
+SAMPLE_QUERIES = [
+    {"source_id": "census_api", "parameters": {}},
+    {"source_id": "usda_quickstats", "parameters": {}},
+]
 
-def test_execute_queries_to_dataframe(sample_responses):
-    engine = SampleQueryEngine(sample_responses)
+
+def test_execute_queries_to_dataframe(analysis_engine):
+    engine = SampleQueryEngine(SAMPLE_RESPONSES, analysis_engine)
     df = engine.execute_queries_to_dataframe(
-        queries=[
-            {"source_id": "census_api", "parameters": {}},
-            {"source_id": "usda_quickstats", "parameters": {}},
-        ],
+        queries=SAMPLE_QUERIES,
         join_on=["state", "year"],
         how="inner",
     )
@@ -101,13 +101,10 @@ def test_execute_queries_to_dataframe(sample_responses):
     assert len(df) == 6
 
 
-def test_analyze_queries_returns_dataframe_and_analysis(sample_responses):
-    engine = SampleQueryEngine(sample_responses)
+def test_analyze_queries_returns_dataframe_and_analysis(analysis_engine):
+    engine = SampleQueryEngine(SAMPLE_RESPONSES, analysis_engine)
     result = engine.analyze_queries(
-        queries=[
-            {"source_id": "census_api", "parameters": {}},
-            {"source_id": "usda_quickstats", "parameters": {}},
-        ],
+        queries=SAMPLE_QUERIES,
         join_on=["state", "year"],
         analysis_plan={
             "basic_statistics": True,
@@ -121,3 +118,27 @@ def test_analyze_queries_returns_dataframe_and_analysis(sample_responses):
     assert isinstance(dataframe, pd.DataFrame)
     assert "linear_regression" in analysis
     assert "coefficients" in analysis["linear_regression"]
+
+
+@pytest.mark.parametrize(
+    "result, expected",
+    [
+        ({"data": {"data": [{"x": 1}, {"x": 2}]}}, [{"x": 1}, {"x": 2}]),
+        ({"data": {"data": {"x": 1}}}, [{"x": 1}]),
+        (
+            {"data": {"data": {"state": ["AL", "AK"], "v": [1, 2]}}},
+            {"state": ["AL", "AK"], "v": [1, 2]},
+        ),
+        (
+            {"data": {"data": {"a": {"x": 1, "y": 2}, "b": {"x": 3, "y": 4}}}},
+            {"a": {"x": 1, "y": 2}, "b": {"x": 3, "y": 4}},
+        ),
+        ({"data": {"data": {"a": (1, 2), "b": (3, 4)}}}, {"a": (1, 2), "b": (3, 4)}),
+        ({"data": {"data": {}}}, []),
+        ({"data": [{"x": 1}]}, [{"x": 1}]),
+        ({"data": None}, []),
+        ({}, []),
+    ],
+)
+def test_extract_records_handles_various_payloads(result, expected):
+    assert QueryEngine._extract_records(result) == expected